@@ -2,18 +2,194 @@
 """
 Update README.md with Code Copycat Defender component status
 """
+import heapq
+import html
 import json
 import os
 import re
+import time
 from datetime import datetime, timezone
-from typing import Dict, List, Optional, Tuple
+from typing import Any, Callable, Dict, List, Optional, Tuple
 import urllib.request
 import urllib.error
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+# Persistent cache for GitHub API responses (kept between runs by the workflow)
+CACHE_FILE = os.environ.get('CCD_CACHE_FILE', '.cache/github_cache.json')
+
+# GitHub statistics endpoints that answer 202 Accepted while computing in the background
+ACTIVITY_ENDPOINTS = ('commit_activity', 'contributors', 'code_frequency')
+
+# Seconds finish() may wait after the component loop for statistics still pending
+ACTIVITY_TAIL = float(os.environ.get('ACTIVITY_TAIL', '3'))
+
+# Background workers and per-request timeout for the /stats/* requests
+ACTIVITY_WORKERS = 8
+ACTIVITY_REQUEST_TIMEOUT = 10
+
+# Component discovery: list repositories of this user/org and keep the matching ones
+COMPONENT_DISCOVERY = os.environ.get('COMPONENT_DISCOVERY', '1') != '0'
+DISCOVERY_OWNER = os.environ.get('DISCOVERY_OWNER', 'oscarvalenzuelab')
+DISCOVERY_OWNER_TYPE = os.environ.get('DISCOVERY_OWNER_TYPE', 'users')  # 'users' or 'orgs'
+DISCOVERY_PREFIX = os.environ.get('DISCOVERY_PREFIX', 'semantic-copycat-')
+DISCOVERY_TOPIC = os.environ.get('DISCOVERY_TOPIC', '')
+
+# Metadata for discovered repositories that have no entry in COMPONENT_OVERRIDES.
+# They are listed as in development until configured.
+DISCOVERED_COMPONENT_DEFAULTS = {
+    'pypi': None,
+    'description': 'No description provided',
+    'category': 'Core',
+    'status': 'development'
+}
+
+# Local component metadata, merged over discovered repositories by repository name.
+# Entries without a GitHub URL (private repositories) are always included as-is.
+# 'status' ('ready' or 'development') decides readiness on both the README and the
+# website; 'status_override' and 'completion_override' only affect the website
+# progress bar and links.
+COMPONENT_OVERRIDES = [
+    {
+        'name': 'Frontend UI',
+        'component_id': 'semantic-copycat-frontend',
+        'github': 'https://github.com/oscarvalenzuelab/semantic-copycat-frontend',
+        'pypi': None,
+        'description': 'Web interface for scan submission and results visualization with enterprise authentication',
+        'category': 'Web Platform',
+        'license': 'MIT',
+        'status': 'development'
+    },
+    {
+        'name': 'Backend API',
+        'component_id': 'semantic-copycat-backend',
+        'github': 'https://github.com/oscarvalenzuelab/semantic-copycat-backend',
+        'pypi': None,
+        'description': 'Core API services with scan queue management, orchestration, and webhook notifications',
+        'category': 'Web Platform',
+        'license': 'MIT',
+        'status': 'development'
+    },
+    {
+        'name': 'PURL to Source',
+        'component_id': 'semantic-copycat-purl2src',
+        'github': 'https://github.com/oscarvalenzuelab/semantic-copycat-purl2src',
+        'pypi': 'semantic-copycat-purl2src',
+        'description': 'Downloads source code from Package URLs supporting npm, PyPI, Maven, Go, and more',
+        'category': 'Analysis Pipeline',
+        'license': 'MIT',
+        'status': 'ready'
+    },
+    {
+        'name': 'Code Miner',
+        'component_id': 'semantic-copycat-miner',
+        'github': None,  # Private repository
+        'pypi': None,
+        'description': 'Extracts code patterns and performs initial license detection using semantic analysis',
+        'category': 'Analysis Pipeline',
+        'license': 'Private Beta',
+        'status': 'ready',
+        'status_override': 'complete',
+        'version_override': '1.7.0'
+    },
+    {
+        'name': 'Binary Sniffer',
+        'component_id': 'semantic-copycat-binarysniffer',
+        'github': 'https://github.com/oscarvalenzuelab/semantic-copycat-binarysniffer',
+        'pypi': 'semantic-copycat-binarysniffer',
+        'description': 'Identifies hidden OSS components embedded in binary files through signature matching',
+        'category': 'Analysis Pipeline',
+        'license': 'MIT',
+        'status': 'ready'
+    },
+    {
+        'name': 'Open Agentic Framework',
+        'component_id': 'open-agentic-framework',
+        'github': 'https://github.com/oscarvalenzuelab/open_agentic_framework',
+        'pypi': None,
+        'description': 'AI-powered analysis framework for intelligent code pattern detection and classification',
+        'category': 'Analysis Pipeline',
+        'license': 'Apache-2.0',
+        'status': 'ready',
+        'status_override': 'complete',
+        'completion_override': 100.0
+    },
+    {
+        'name': 'OS License Identification Library',
+        'component_id': 'semantic-copycat-oslili',
+        'github': 'https://github.com/oscarvalenzuelab/semantic-copycat-oslili',
+        'pypi': 'semantic-copycat-oslili',
+        'description': 'High-performance license detection across 700+ SPDX identifiers with confidence scores',
+        'category': 'License Analysis',
+        'license': 'Apache-2.0',
+        'status': 'ready',
+        'status_override': 'complete',
+        'completion_override': 100.0
+    },
+    {
+        'name': 'PURL to Notice',
+        'component_id': 'semantic-copycat-purl2notice',
+        'github': 'https://github.com/oscarvalenzuelab/semantic-copycat-purl2notices',
+        'pypi': 'semantic-copycat-purl2notices',
+        'description': 'Generates legal notices with licenses and copyright information for compliance',
+        'category': 'License Analysis',
+        'license': 'MIT',
+        'status': 'ready',
+        'status_override': 'complete',
+        'completion_override': 100.0
+    },
+    {
+        'name': 'CCDA',
+        'component_id': 'semantic-copycat-ccda',
+        'github': 'https://github.com/oscarvalenzuelab/semantic-copycat-ccda',
+        'pypi': None,
+        'description': 'Code Copycat Defender Advisory - Evolution of OSSA Scanner for semantic code copycat detection',
+        'category': 'License Analysis',
+        'license': 'MIT',
+        'status': 'development'
+    },
+    {
+        'name': 'UPMEX',
+        'component_id': 'semantic-copycat-upmex',
+        'github': 'https://github.com/oscarvalenzuelab/semantic-copycat-upmex',
+        'pypi': 'semantic-copycat-upmex',
+        'description': 'Universal package metadata extractor supporting 13 package ecosystems',
+        'category': 'Analysis Pipeline',
+        'license': 'MIT',
+        'status': 'ready',
+        'status_override': 'complete',
+        'completion_override': 100.0
+    },
+    {
+        'name': 'Source To ID',
+        'component_id': 'semantic-copycat-src2id',
+        'github': 'https://github.com/oscarvalenzuelab/semantic-copycat-src2id',
+        'pypi': 'semantic-copycat-src2id',
+        'description': 'Identifies package coordinates from source code using SWHIDs and multiple strategies',
+        'category': 'Analysis Pipeline',
+        'license': 'AGPL-3.0',
+        'status': 'ready',
+        'status_override': 'complete',
+        'completion_override': 100.0
+    },
+    {
+        'name': 'PURL2Risk',
+        'component_id': 'semantic-copycat-purl2risk',
+        'github': 'https://github.com/oscarvalenzuelab/semantic-copycat-purl2risk',
+        'pypi': None,
+        'description': 'Comprehensive risk intelligence including CVEs, business continuity, and OSS health metrics',
+        'category': 'Risk Analysis',
+        'license': 'MIT',
+        'status': 'development'
+    }
+]
 
-def fetch_github_stats(owner: str, repo: str) -> Optional[Dict]:
-    """Fetch repository statistics from GitHub API"""
-    base_url = f"https://api.github.com/repos/{owner}/{repo}"
-    
+# Semantic version tags such as v1.2.3, 1.2 or 2.0.0-rc.1
+SEMVER_PATTERN = re.compile(
+    r'^v?(\d+)\.(\d+)(?:\.(\d+))?(?:-([0-9A-Za-z.-]+))?(?:\+[0-9A-Za-z.-]+)?$'
+)
+
+def get_github_headers() -> Dict[str, str]:
+    """Build the request headers used for all GitHub API calls"""
     headers = {
         'Accept': 'application/vnd.github.v3+json',
         'User-Agent': 'CopycatCodeDefender-Bot'
@@ -24,6 +200,124 @@ def fetch_github_stats(owner: str, repo: str) -> Optional[Dict]:
     if github_token:
         headers['Authorization'] = f'token {github_token}'
     
+    return headers
+
+def load_cache(path: str = CACHE_FILE) -> Dict:
+    """Load the GitHub API cache from disk"""
+    try:
+        with open(path, 'r') as f:
+            return json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return {}
+
+def save_cache(cache: Dict, path: str = CACHE_FILE) -> None:
+    """Write the GitHub API cache to disk"""
+    try:
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(path, 'w') as f:
+            json.dump(cache, f, indent=2, sort_keys=True)
+    except OSError as e:
+        print(f"Error writing cache {path}: {e}")
+
+def get_next_page_url(link_header: str) -> Optional[str]:
+    """Extract the rel="next" URL from a GitHub Link header"""
+    match = re.search(r'<([^>]+)>;\s*rel="next"', link_header or '')
+    if match:
+        return match.group(1)
+    return None
+
+def parse_semver(tag: str) -> Optional[Tuple]:
+    """Parse a tag name into (major, minor, patch, prerelease)"""
+    match = SEMVER_PATTERN.match(tag.strip())
+    if not match:
+        return None
+    major, minor, patch, prerelease = match.groups()
+    return int(major), int(minor), int(patch or 0), prerelease
+
+def semver_sort_key(parsed: Tuple) -> Tuple:
+    """Sort key ordering pre-releases before the matching final release"""
+    major, minor, patch, prerelease = parsed
+    if prerelease is None:
+        return (major, minor, patch, 1, ())
+    identifiers = tuple(
+        (0, int(part), '') if part.isdigit() else (1, 0, part)
+        for part in prerelease.split('.')
+    )
+    return (major, minor, patch, 0, identifiers)
+
+def select_latest_version(tags: List[str], include_prereleases: bool = False) -> Optional[str]:
+    """Pick the highest semantic version from a list of tag names"""
+    candidates = []
+    for tag in tags:
+        parsed = parse_semver(tag)
+        if not parsed:
+            continue
+        if parsed[3] is not None and not include_prereleases:
+            continue
+        candidates.append((semver_sort_key(parsed), tag))
+    
+    if not candidates:
+        return None
+    return max(candidates)[1].strip().lstrip('v')
+
+def fetch_cached_pages(url: str, page_cache: Dict, extract: Callable[[Dict], Any]) -> Optional[List]:
+    """Fetch every page of a GitHub list endpoint, revalidating each page by its ETag
+    
+    Unchanged pages answer 304 (free against the rate limit) and are served from
+    page_cache, which stores the extracted items and next link per page URL. When
+    a request fails the cached copy of that page is used instead. Returns None if
+    a page can be neither fetched nor served from the cache.
+    """
+    items = []
+    while url:
+        cached = page_cache.get(url)
+        headers = get_github_headers()
+        if cached and cached.get('etag'):
+            headers['If-None-Match'] = cached['etag']
+        
+        try:
+            req = urllib.request.Request(url, headers=headers)
+            with urllib.request.urlopen(req) as response:
+                page = json.loads(response.read().decode())
+                cached = {
+                    'etag': response.headers.get('ETag'),
+                    'next': get_next_page_url(response.headers.get('Link', '')),
+                    'items': [extract(item) for item in page]
+                }
+                page_cache[url] = cached
+        except urllib.error.HTTPError as e:
+            if e.code == 404:
+                return None
+            if e.code != 304:
+                print(f"Error fetching {url}: {e}")
+            if not cached:
+                return None
+        except (urllib.error.URLError, json.JSONDecodeError) as e:
+            print(f"Error fetching {url}: {e}")
+            if not cached:
+                return None
+        
+        items.extend(cached['items'])
+        url = cached.get('next')
+    
+    return items
+
+def fetch_tag_version(owner: str, repo: str, cache: Dict, include_prereleases: bool = False) -> Optional[str]:
+    """Resolve the latest version from repository tags, cached per page by ETag"""
+    url = f"https://api.github.com/repos/{owner}/{repo}/tags?per_page=100"
+    tags = fetch_cached_pages(url, cache.setdefault('tags', {}), lambda tag: tag.get('name', ''))
+    if tags is None:
+        return None
+    return select_latest_version(tags, include_prereleases)
+
+def fetch_github_stats(owner: str, repo: str, cache: Optional[Dict] = None,
+                       include_prereleases: bool = False) -> Optional[Dict]:
+    """Fetch repository statistics from GitHub API"""
+    base_url = f"https://api.github.com/repos/{owner}/{repo}"
+    headers = get_github_headers()
+    
     try:
         # Fetch repo info
         req = urllib.request.Request(base_url, headers=headers)
@@ -37,8 +331,16 @@ def fetch_github_stats(owner: str, repo: str) -> Optional[Dict]:
             with urllib.request.urlopen(release_req) as response:
                 release_data = json.loads(response.read().decode())
                 latest_version = release_data.get('tag_name', '0.0.0').lstrip('v')
+        except urllib.error.HTTPError as e:
+            if e.code == 404:
+                # No releases yet, fall back to the highest semantic version tag
+                tag_version = fetch_tag_version(
+                    owner, repo, cache if cache is not None else {}, include_prereleases
+                )
+                if tag_version:
+                    latest_version = tag_version
+            # Other errors (rate limit, server errors) keep 0.0.0 without extra requests
         except:
-            # No releases yet
             pass
         
         # Fetch issues info
@@ -83,6 +385,7 @@ def fetch_github_stats(owner: str, repo: str) -> Optional[Dict]:
             'latest_version': latest_version,
             'updated_at': data.get('updated_at', 'N/A'),
             'created_at': data.get('created_at', 'N/A'),
+            'pushed_at': data.get('pushed_at'),
             'default_branch': data.get('default_branch', 'main'),
             'open_issues': open_issues,
             'closed_issues': closed_issues,
@@ -97,6 +400,130 @@ def fetch_github_stats(owner: str, repo: str) -> Optional[Dict]:
         print(f"Error fetching stats for {owner}/{repo}: {e}")
         return None
 
+def summarize_activity(endpoint: str, data: List) -> Dict:
+    """Reduce a /stats/* payload to the figures shown on component cards"""
+    if endpoint == 'commit_activity':
+        totals = [week.get('total', 0) for week in data]
+        return {'commits_year': sum(totals)}
+    if endpoint == 'contributors':
+        return {'contributors': len(data)}
+    if endpoint == 'code_frequency':
+        recent = data[-12:]
+        return {
+            'additions': sum(week[1] for week in recent),
+            'deletions': -sum(week[2] for week in recent)
+        }
+    return {}
+
+class ActivityMetricsCollector:
+    """Collect GitHub /stats/* activity metrics without blocking on 202 responses
+    
+    submit() hands the requests for a repository to background workers and
+    returns at once. poll_due() handles finished requests and re-requests
+    endpoints that answered 202 once their backoff has passed; it never waits
+    and is meant to be called between components. finish() waits at most
+    tail_seconds for whatever is still pending, and anything not ready by then
+    keeps its cached value. Results are cached until the repository's
+    pushed_at changes.
+    """
+    
+    def __init__(self, cache: Dict, tail_seconds: float = ACTIVITY_TAIL,
+                 initial_delay: float = 1.0, max_delay: float = 8.0):
+        self.cache = cache.setdefault('activity', {})
+        self.tail_seconds = tail_seconds
+        self.initial_delay = initial_delay
+        self.max_delay = max_delay
+        self.executor = ThreadPoolExecutor(max_workers=ACTIVITY_WORKERS)
+        self.in_flight = []
+        self.pending = []  # heap of (next_poll, delay, repo_key, endpoint)
+        self.results = {}
+        self.pushed_at = {}
+    
+    def submit(self, owner: str, repo: str, pushed_at: Optional[str]) -> None:
+        """Start the statistics requests for a repository unless its cache is current"""
+        key = f"{owner}/{repo}"
+        cached = self.cache.get(key)
+        if cached and pushed_at and cached.get('pushed_at') == pushed_at:
+            return
+        
+        self.pushed_at[key] = pushed_at
+        self.results[key] = {}
+        for endpoint in ACTIVITY_ENDPOINTS:
+            self._start(key, endpoint, self.initial_delay)
+    
+    def _start(self, key: str, endpoint: str, delay: float) -> None:
+        """Queue one statistics request on the background workers"""
+        self.in_flight.append(self.executor.submit(self._request, key, endpoint, delay))
+    
+    def _request(self, key: str, endpoint: str, delay: float) -> Tuple:
+        """Request one statistics endpoint (runs on a worker thread)"""
+        url = f"https://api.github.com/repos/{key}/stats/{endpoint}"
+        try:
+            req = urllib.request.Request(url, headers=get_github_headers())
+            with urllib.request.urlopen(req, timeout=ACTIVITY_REQUEST_TIMEOUT) as response:
+                if response.status == 202:
+                    return key, endpoint, delay, 'pending', None
+                body = response.read().decode()
+                data = json.loads(body) if response.status != 204 and body else []
+        except urllib.error.HTTPError as e:
+            if e.code in (404, 422):
+                # Not available for this repository (e.g. too many commits)
+                return key, endpoint, delay, 'done', {}
+            print(f"Error fetching {endpoint} stats for {key}: {e}")
+            return key, endpoint, delay, 'error', None
+        except (urllib.error.URLError, OSError, json.JSONDecodeError) as e:
+            print(f"Error fetching {endpoint} stats for {key}: {e}")
+            return key, endpoint, delay, 'error', None
+        
+        return key, endpoint, delay, 'done', summarize_activity(endpoint, data or [])
+    
+    def poll_due(self) -> None:
+        """Handle finished requests and re-request due endpoints, without waiting"""
+        finished = [future for future in self.in_flight if future.done()]
+        for future in finished:
+            self.in_flight.remove(future)
+            key, endpoint, delay, state, metrics = future.result()
+            if state == 'pending':
+                heapq.heappush(self.pending, (time.monotonic() + delay, delay, key, endpoint))
+            elif state == 'done':
+                self.results[key][endpoint] = metrics
+        
+        now = time.monotonic()
+        while self.pending and self.pending[0][0] <= now:
+            _, delay, key, endpoint = heapq.heappop(self.pending)
+            self._start(key, endpoint, min(delay * 2, self.max_delay))
+    
+    def finish(self) -> Dict[str, Dict]:
+        """Wait up to the tail budget for pending endpoints and return metrics per repository"""
+        deadline = time.monotonic() + self.tail_seconds
+        while True:
+            self.poll_due()
+            remaining = deadline - time.monotonic()
+            if remaining <= 0 or not (self.in_flight or self.pending):
+                break
+            if self.pending:
+                remaining = min(remaining, max(self.pending[0][0] - time.monotonic(), 0))
+            if self.in_flight:
+                wait(self.in_flight, timeout=remaining, return_when=FIRST_COMPLETED)
+            else:
+                time.sleep(remaining)
+        
+        # Abandon whatever is still outstanding; it keeps its cached value
+        self.executor.shutdown(wait=False, cancel_futures=True)
+        self.in_flight = []
+        self.pending = []
+        
+        # Merge fresh results into the cache; only a complete set marks it current
+        for key, fresh in self.results.items():
+            entry = self.cache.setdefault(key, {'pushed_at': None, 'metrics': {}})
+            for metrics in fresh.values():
+                entry['metrics'].update(metrics)
+            if len(fresh) == len(ACTIVITY_ENDPOINTS):
+                entry['pushed_at'] = self.pushed_at[key]
+        self.results = {}
+        
+        return {key: entry.get('metrics', {}) for key, entry in self.cache.items()}
+
 def fetch_pypi_stats(package_name: str) -> Optional[Dict]:
     """Fetch package statistics from PyPI"""
     url = f"https://pypi.org/pypi/{package_name}/json"
@@ -132,124 +559,83 @@ def calculate_completion(closed_issues: int, total_issues: int) -> float:
         return 0.0
     return (closed_issues / total_issues) * 100
 
+def escape_markdown_cell(text: str) -> str:
+    """Make text safe to place inside a markdown table cell"""
+    return html.escape(' '.join(str(text).split()), quote=False).replace('|', '\\|')
+
 def get_progress_bar(percentage: float, width: int = 50) -> str:
     """Create a visual progress bar"""
     filled = int((percentage / 100) * width)
     empty = width - filled
     return "█" * filled + "░" * empty
 
-def update_readme():
-    """Main function to update README with latest stats"""
+def fetch_repo_listing(owner: str, owner_type: str, cache: Dict) -> Optional[List[Dict]]:
+    """List all repositories of a user or org, cached per page by ETag"""
+    url = f"https://api.github.com/{owner_type}/{owner}/repos?per_page=100&sort=full_name"
+    return fetch_cached_pages(url, cache.setdefault('discovery', {}), lambda item: {
+        'name': item.get('name'),
+        'html_url': item.get('html_url'),
+        'description': item.get('description'),
+        'topics': item.get('topics', []),
+        'license': (item.get('license') or {}).get('spdx_id'),
+        'archived': item.get('archived', False),
+        'fork': item.get('fork', False)
+    })
+
+def is_discovered_component(repo: Dict) -> bool:
+    """Check whether a listed repository matches the discovery filters"""
+    if repo.get('archived') or repo.get('fork'):
+        return False
+    if DISCOVERY_TOPIC:
+        return DISCOVERY_TOPIC in (repo.get('topics') or [])
+    return repo.get('name', '').startswith(DISCOVERY_PREFIX)
+
+def get_display_name(repo_name: str) -> str:
+    """Derive a component name from a repository name"""
+    if repo_name.startswith(DISCOVERY_PREFIX):
+        repo_name = repo_name[len(DISCOVERY_PREFIX):]
+    return repo_name.replace('-', ' ').replace('_', ' ').title()
+
+def load_components(cache: Dict) -> List[Dict]:
+    """Build the component registry from discovered repositories and local overrides"""
+    if not COMPONENT_DISCOVERY:
+        return [dict(component) for component in COMPONENT_OVERRIDES]
     
-    # Define all components of Code Copycat Defender - Updated list
-    components = [
-        {
-            'name': 'Frontend UI',
-            'github': 'https://github.com/oscarvalenzuelab/semantic-copycat-frontend',
-            'pypi': None,
-            'description': 'Web interface for scan submission and results visualization with enterprise authentication',
-            'license': 'MIT',
-            'status': 'development'
-        },
-        {
-            'name': 'Backend API',
-            'github': 'https://github.com/oscarvalenzuelab/semantic-copycat-backend',
-            'pypi': None,
-            'description': 'Core API services with scan queue management, orchestration, and webhook notifications',
-            'license': 'MIT',
-            'status': 'development'
-        },
-        {
-            'name': 'PURL to Source',
-            'github': 'https://github.com/oscarvalenzuelab/semantic-copycat-purl2src',
-            'pypi': 'semantic-copycat-purl2src',
-            'description': 'Downloads source code from Package URLs supporting npm, PyPI, Maven, Go, and more',
-            'license': 'MIT',
-            'status': 'ready',
-            'version_override': '0.1.1'
-        },
-        {
-            'name': 'Code Miner',
-            'github': None,  # Private repository
-            'pypi': None,
-            'description': 'Extracts code patterns and performs initial license detection using semantic analysis',
-            'license': 'Private Beta',
-            'status': 'ready',
-            'version_override': '1.7.0'
-        },
-        {
-            'name': 'Binary Sniffer',
-            'github': 'https://github.com/oscarvalenzuelab/semantic-copycat-binarysniffer',
-            'pypi': 'semantic-copycat-binarysniffer',
-            'description': 'Identifies hidden OSS components embedded in binary files through signature matching',
-            'license': 'MIT',
-            'status': 'ready',
-            'version_override': '1.10.0'
-        },
-        {
-            'name': 'Open Agentic Framework',
-            'github': 'https://github.com/oscarvalenzuelab/open_agentic_framework',
-            'pypi': None,
-            'description': 'AI-powered analysis framework for intelligent code pattern detection and classification',
-            'license': 'Apache-2.0',
-            'status': 'ready',
-            'version_override': '1.1.0'
-        },
-        {
-            'name': 'OS License Identification Library',
-            'github': 'https://github.com/oscarvalenzuelab/semantic-copycat-oslili',
-            'pypi': 'semantic-copycat-oslili',
-            'description': 'High-performance license detection across 700+ SPDX identifiers with confidence scores',
-            'license': 'Apache-2.0',
-            'status': 'ready',
-            'version_override': '1.2.6'
-        },
-        {
-            'name': 'PURL to Notice',
-            'github': 'https://github.com/oscarvalenzuelab/semantic-copycat-purl2notices',
-            'pypi': 'semantic-copycat-purl2notices',
-            'description': 'Generates legal notices with licenses and copyright information for compliance',
-            'license': 'MIT',
-            'status': 'ready',
-            'version_override': '1.1.3'
-        },
-        {
-            'name': 'CCDA',
-            'github': 'https://github.com/oscarvalenzuelab/semantic-copycat-ccda',
-            'pypi': None,
-            'description': 'Code Copycat Defender Advisory - Evolution of OSSA Scanner for semantic code copycat detection',
-            'license': 'MIT',
-            'status': 'development'
-        },
-        {
-            'name': 'UPMEX',
-            'github': 'https://github.com/oscarvalenzuelab/semantic-copycat-upmex',
-            'pypi': 'semantic-copycat-upmex',
-            'description': 'Universal package metadata extractor supporting 13 package ecosystems',
-            'license': 'MIT',
-            'status': 'ready',
-            'version_override': '1.5.0'
-        },
-        {
-            'name': 'Source To ID',
-            'github': 'https://github.com/oscarvalenzuelab/semantic-copycat-src2id',
-            'pypi': 'semantic-copycat-src2id',
-            'description': 'Identifies package coordinates from source code using SWHIDs and multiple strategies',
-            'license': 'AGPL-3.0',
-            'status': 'ready',
-            'version_override': '1.1.2'
-        },
-        {
-            'name': 'PURL2Risk',
-            'github': 'https://github.com/oscarvalenzuelab/semantic-copycat-purl2risk',
-            'pypi': None,
-            'description': 'Comprehensive risk intelligence including CVEs, business continuity, and OSS health metrics',
-            'license': 'MIT',
-            'status': 'development'
+    # Failed pages are served from the page cache; with nothing cached only overrides are used
+    repos = fetch_repo_listing(DISCOVERY_OWNER, DISCOVERY_OWNER_TYPE, cache) or []
+    
+    discovered = {}
+    for repo in repos:
+        if not is_discovered_component(repo):
+            continue
+        license_id = repo.get('license')
+        component = {
+            'name': get_display_name(repo['name']),
+            'component_id': repo['name'],
+            'github': repo['html_url'],
+            'license': license_id if license_id and license_id != 'NOASSERTION' else 'TBD'
         }
-    ]
+        if repo.get('description'):
+            component['description'] = repo['description']
+        discovered[repo['name']] = component
+    
+    # Overrides keep their order; newly discovered repositories are appended
+    registry = []
+    for override in COMPONENT_OVERRIDES:
+        parsed = parse_github_url(override['github']) if override.get('github') else None
+        base = discovered.pop(parsed[1], {}) if parsed else {}
+        registry.append({**base, **override})
+    for repo_name in sorted(discovered):
+        registry.append({**DISCOVERED_COMPONENT_DEFAULTS, **discovered[repo_name]})
     
-    # Fetch stats for all components
+    return registry
+
+def update_readme():
+    """Main function to update README with latest stats"""
+    
+    # Build the component registry, then fetch stats for all components
+    cache = load_cache()
+    components = load_components(cache)
     component_stats = []
     total_ready = 0
     total_dev = 0
@@ -258,7 +644,7 @@ def update_readme():
         stats = {
             'name': component['name'],
             'description': component['description'],
-            'license': component.get('license', 'MIT'),
+            'license': component.get('license', 'TBD'),
             'version': component.get('version_override', '0.0.0'),
             'status': component.get('status', 'development'),
             'github_url': component.get('github', ''),
@@ -272,7 +658,9 @@ def update_readme():
             parsed = parse_github_url(component['github'])
             if parsed:
                 owner, repo = parsed
-                github_stats = fetch_github_stats(owner, repo)
+                github_stats = fetch_github_stats(
+                    owner, repo, cache, component.get('include_prereleases', False)
+                )
                 if github_stats:
                     stats['github_exists'] = github_stats.get('exists', False)
                     if not component.get('version_override'):
@@ -294,6 +682,8 @@ def update_readme():
         
         component_stats.append(stats)
     
+    save_cache(cache)
+    
     # Calculate overall project completion
     overall_completion = (total_ready / len(components)) * 100
     
@@ -348,10 +738,10 @@ def update_readme():
                     links.append(f"[PyPI]({stats['pypi_url']})")
         
         readme_content += "| **{}**<br/>*{}* | {} | {} | {} | {} |\n".format(
-            stats['name'],
-            stats['description'],
+            escape_markdown_cell(stats['name']),
+            escape_markdown_cell(stats['description']),
             stats['version'],
-            stats['license'],
+            escape_markdown_cell(stats['license']),
             status_icon,
             ' · '.join(links) if links else 'GitHub (planned)'
         )